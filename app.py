@@ -5,10 +5,43 @@ import numpy as np
 import plotly.express as px
 import plotly.graph_objects as go
 from datetime import datetime
+import threading
 import utils
 import database
-import base64
-from io import StringIO
+
+# Form options, built once at import rather than on every rerun
+TRANSPORT_OPTIONS = (
+    ("car_petrol", "Petrol/Gasoline Car"),
+    ("car_diesel", "Diesel Car"),
+    ("car_electric", "Electric Vehicle"),
+    ("public_transport", "Public Transport"),
+    ("motorcycle", "Motorcycle")
+)
+TRANSPORT_KEYS = tuple(k for k, _ in TRANSPORT_OPTIONS)
+TRANSPORT_LABEL = dict(TRANSPORT_OPTIONS)
+
+DIET_OPTIONS = (
+    ("meat_beef", "Beef meals"),
+    ("meat_pork", "Pork meals"),
+    ("meat_chicken", "Chicken meals"),
+    ("vegetarian", "Vegetarian meals"),
+    ("vegan", "Vegan meals")
+)
+
+COUNTRY_KEYS = tuple(utils.NATIONAL_AVERAGES)
+
+# Number of saved footprints fetched and shown per page
+FOOTPRINTS_PER_PAGE = 100
+
+# Diet categories in form order
+_DIET_ORDER = tuple(k for k, _ in DIET_OPTIONS)
+
+# The form only offers these categories, so validate them once here and index the factors directly afterwards
+utils.validate_categories(TRANSPORT_KEYS + _DIET_ORDER)
+
+# Assuming average distances for flights
+_SHORT_FLIGHT_DISTANCE = 1000  # km for short-haul flight
+_LONG_FLIGHT_DISTANCE = 6000   # km for long-haul flight
 
 # Page configuration
 st.set_page_config(
@@ -17,12 +50,133 @@ st.set_page_config(
     layout="wide"
 )
 
+# Create the database tables once per process rather than on every rerun
+@st.cache_resource(show_spinner=False)
+def _init_db():
+    database.create_tables()
+    return True
+
+_init_db()
+
 # Initialize session state variables
 if "calculated" not in st.session_state:
     st.session_state.calculated = False
 if "results" not in st.session_state:
     st.session_state.results = {}
 
+# Cached figure builders (Streamlit reruns the whole script on every widget change)
+@st.cache_data(ttl=3600, max_entries=64, show_spinner=False)
+def _build_gauge(annual_total, national_avg):
+    """Build the gauge chart comparing the annual footprint to the national average."""
+    fig = go.Figure(go.Indicator(
+        mode = "gauge+number+delta",
+        value = annual_total,
+        domain = {'x': [0, 1], 'y': [0, 1]},
+        title = {'text': "Your Annual Footprint (kg CO₂)"},
+        gauge = {
+            'axis': {'range': [None, max(national_avg * 2, annual_total * 1.2)]},
+            'bar': {'color': "darkblue"},
+            'steps': [
+                {'range': [0, national_avg * 0.5], 'color': "lightgreen"},
+                {'range': [national_avg * 0.5, national_avg * 0.8], 'color': "green"},
+                {'range': [national_avg * 0.8, national_avg * 1.2], 'color': "yellow"},
+                {'range': [national_avg * 1.2, national_avg * 2], 'color': "orange"},
+                {'range': [national_avg * 2, national_avg * 3], 'color': "red"}
+            ],
+            'threshold': {
+                'line': {'color': "red", 'width': 4},
+                'thickness': 0.75,
+                'value': national_avg
+            }
+        },
+        delta = {'reference': national_avg, 'relative': True}
+    ))
+    
+    fig.update_layout(height=300, margin=dict(l=20, r=20, t=50, b=20))
+    return fig
+
+@st.cache_data(ttl=3600, max_entries=64, show_spinner=False)
+def _build_breakdown_pie(breakdown_items):
+    """Build the weekly breakdown pie chart from a tuple of (category, emissions) pairs.
+
+    Shared by the Results and Saved Footprints tabs, so each unique breakdown is built once.
+    """
+    labels = [category for category, _ in breakdown_items]
+    values = [value for _, value in breakdown_items]
+    fig = go.Figure(go.Pie(
+        labels=labels,
+        values=values,
+        marker=dict(colors=px.colors.sequential.Viridis),
+        textposition='inside',
+        textinfo='percent+label'
+    ))
+    fig.update_layout(title='Weekly Carbon Footprint by Category', margin=dict(t=40, b=0, l=0, r=0))
+    return fig
+
+@st.cache_resource(show_spinner=False)
+def _national_bar_figure():
+    """Build the national averages bar chart (static, built once per process)."""
+    countries = list(utils.NATIONAL_AVERAGES.keys())
+    values = list(utils.NATIONAL_AVERAGES.values())
+    fig = go.Figure(go.Bar(
+        x=countries,
+        y=values,
+        marker=dict(
+            color=values,
+            colorscale=px.colors.sequential.Viridis,
+            showscale=True,
+            colorbar=dict(title='Annual CO₂ Emissions Per Person (kg)')
+        )
+    ))
+    fig.update_layout(
+        title='Average Annual Carbon Footprint by Country',
+        xaxis_title="Country",
+        yaxis_title="kg CO₂ per person"
+    )
+    return fig
+
+# Version of the saved footprints, shared by every session in the process like the cache_data entries it keys
+@st.cache_resource(show_spinner=False)
+def _footprints_version():
+    return {"value": 0, "lock": threading.Lock()}
+
+def _current_fp_version():
+    return _footprints_version()["value"]
+
+def _bump_fp_version():
+    version = _footprints_version()
+    with version["lock"]:
+        version["value"] += 1
+
+# Cached database reads (the version key is bumped after every save/delete to invalidate)
+@st.cache_data(ttl=30, show_spinner=False)
+def _cached_all_footprints_df(version, offset=0):
+    return database.get_all_footprints_df(limit=FOOTPRINTS_PER_PAGE, offset=offset)
+
+@st.cache_data(ttl=30, show_spinner=False)
+def _cached_footprint_timeline_df(version):
+    return database.get_footprint_timeline_df()
+
+@st.cache_data(ttl=30, show_spinner=False)
+def _cached_footprint_stats(version):
+    return database.get_footprint_stats()
+
+@st.cache_data(ttl=30, show_spinner=False)
+def _cached_footprints_by_email(email, version):
+    return [dict(f) for f in database.get_footprints_by_email(email, limit=FOOTPRINTS_PER_PAGE)]
+
+@st.cache_data(ttl=30, show_spinner=False)
+def _cached_footprint_count_by_email(email, version):
+    return database.count_footprints_by_email(email)
+
+# Saved timestamps are datetimes; let Streamlit format them natively in tables
+_DATE_SAVED_COLUMN = {"Date Saved": st.column_config.DatetimeColumn(format="YYYY-MM-DD HH:mm:ss")}
+
+# Cached CSV export of a results dict
+@st.cache_data(ttl=3600, max_entries=64, show_spinner=False)
+def _csv_bytes(results_dict):
+    return utils.format_emissions_for_download(results_dict).to_csv(index=False).encode()
+
 # Title and introduction
 st.title("🌍 Carbon Footprint Calculator")
 st.markdown("**Made by Advait Sharma**")
@@ -34,23 +188,18 @@ Answer a few questions about your transportation, energy usage, and diet to see
 # Create tabs for different sections
 tab1, tab2, tab3, tab4, tab5 = st.tabs(["Calculator", "Results", "Recommendations", "About Carbon Footprints", "Saved Footprints"])
 
-with tab1:
+# Each tab with its own widgets is a fragment, so interacting with it only reruns that tab
+@st.fragment
+def calculator_tab():
     st.header("Calculate Your Carbon Footprint")
     
     # Create form for user inputs
     with st.form("carbon_calculator_form"):
         st.subheader("🚗 Transportation")
-        transport_options = {
-            "car_petrol": "Petrol/Gasoline Car",
-            "car_diesel": "Diesel Car",
-            "car_electric": "Electric Vehicle",
-            "public_transport": "Public Transport",
-            "motorcycle": "Motorcycle"
-        }
         transport_type = st.selectbox(
             "What is your primary mode of transportation?",
-            options=list(transport_options.keys()),
-            format_func=lambda x: transport_options[x]
+            options=TRANSPORT_KEYS,
+            format_func=TRANSPORT_LABEL.__getitem__
         )
         
         weekly_distance = st.number_input(
@@ -74,10 +223,6 @@ with tab1:
             step=1
         )
         
-        # Assuming average distances for flights
-        short_flight_distance = 1000  # km for short-haul flight
-        long_flight_distance = 6000   # km for long-haul flight
-        
         st.markdown("---")
         
         st.subheader("💡 Household Energy")
@@ -98,17 +243,9 @@ with tab1:
         st.markdown("---")
         
         st.subheader("🍽️ Diet")
-        diet_options = {
-            "meat_beef": "Beef meals",
-            "meat_pork": "Pork meals",
-            "meat_chicken": "Chicken meals",
-            "vegetarian": "Vegetarian meals",
-            "vegan": "Vegan meals"
-        }
-        
         st.write("How many of the following meals do you eat per week?")
         diet_inputs = {}
-        for diet_key, diet_label in diet_options.items():
+        for diet_key, diet_label in DIET_OPTIONS:
             diet_inputs[diet_key] = st.number_input(
                 f"{diet_label}",
                 min_value=0,
@@ -121,63 +258,40 @@ with tab1:
         st.subheader("🌎 Country")
         country = st.selectbox(
             "Select your country for comparison with national average:",
-            options=list(utils.NATIONAL_AVERAGES.keys())
+            options=COUNTRY_KEYS
         )
         
         # Submit button
         submitted = st.form_submit_button("Calculate My Footprint")
         
         if submitted:
-            # Calculate emissions from transportation
-            transport_emissions = utils.calculate_transportation_emissions(transport_type, weekly_distance)
-            
-            # Calculate emissions from flights (convert to weekly)
-            flight_short_emissions = (short_flights * short_flight_distance * utils.EMISSION_FACTORS["flight_short"]) / 52
-            flight_long_emissions = (long_flights * long_flight_distance * utils.EMISSION_FACTORS["flight_long"]) / 52
-            
-            # Calculate emissions from household energy
-            household_emissions = utils.calculate_household_emissions(electricity_kwh, gas_kwh)
-            
-            # Calculate emissions from diet
-            diet_emissions = {}
-            for diet_type, meals in diet_inputs.items():
-                diet_emissions[diet_type] = utils.calculate_food_emissions(diet_type, meals)
-            
-            total_diet_emissions = sum(diet_emissions.values())
+            # Weekly amount per emission category (flights converted to weekly km)
+            entries = {
+                transport_type: weekly_distance,
+                "flight_short": short_flights * _SHORT_FLIGHT_DISTANCE / 52,
+                "flight_long": long_flights * _LONG_FLIGHT_DISTANCE / 52,
+                "electricity": electricity_kwh,
+                "natural_gas": gas_kwh,
+                **diet_inputs
+            }
             
-            # Calculate weekly and annual totals
-            weekly_total = (
-                transport_emissions + 
-                flight_short_emissions + 
-                flight_long_emissions + 
-                household_emissions + 
-                total_diet_emissions
-            )
+            # Calculate weekly and annual totals, with the detailed data for recommendations
+            weekly_total, detailed_emissions = utils.compute_weekly_total(entries)
             annual_total = weekly_total * 52
             
             # Prepare breakdown of emissions
             weekly_breakdown = {
-                "Transportation": transport_emissions,
-                "Short Flights": flight_short_emissions,
-                "Long Flights": flight_long_emissions,
-                "Household Energy": household_emissions,
-                "Diet": total_diet_emissions
-            }
-            
-            # Get detailed data for recommendations
-            detailed_emissions = {
-                transport_type: transport_emissions,
-                "flight_short": flight_short_emissions,
-                "flight_long": flight_long_emissions,
-                "electricity": electricity_kwh * utils.EMISSION_FACTORS["electricity"],
-                "natural_gas": gas_kwh * utils.EMISSION_FACTORS["natural_gas"],
-                **diet_emissions
+                "Transportation": detailed_emissions[transport_type],
+                "Short Flights": detailed_emissions["flight_short"],
+                "Long Flights": detailed_emissions["flight_long"],
+                "Household Energy": detailed_emissions["electricity"] + detailed_emissions["natural_gas"],
+                "Diet": sum(detailed_emissions[k] for k in _DIET_ORDER)
             }
             
             # Get comparison with national average
             comparison = utils.get_footprint_comparison(annual_total, country)
             
-            # Get recommendations
+            # Get recommendations (a shared tuple of constant strings, treat as read-only)
             recommendations = utils.get_recommendations(detailed_emissions)
             
             # Store results in session state
@@ -191,11 +305,20 @@ with tab1:
             }
             
             st.session_state.calculated = True
+            st.session_state.just_calculated = True
             
-            # Success message and redirect to results tab
+            # Rerun the full app so the Results and Recommendations tabs pick up the new results
+            st.rerun()
+        
+        # Success message and redirect to results tab
+        if st.session_state.pop("just_calculated", False):
             st.success("Your carbon footprint has been calculated! Check the Results tab.")
 
-with tab2:
+with tab1:
+    calculator_tab()
+
+@st.fragment
+def results_tab():
     st.header("Your Carbon Footprint Results")
     
     if st.session_state.calculated:
@@ -245,31 +368,7 @@ with tab2:
             
         with col2:
             # Create gauge chart for comparison
-            fig = go.Figure(go.Indicator(
-                mode = "gauge+number+delta",
-                value = results['annual_total'],
-                domain = {'x': [0, 1], 'y': [0, 1]},
-                title = {'text': "Your Annual Footprint (kg CO₂)"},
-                gauge = {
-                    'axis': {'range': [None, max(comparison['national_avg'] * 2, results['annual_total'] * 1.2)]},
-                    'bar': {'color': "darkblue"},
-                    'steps': [
-                        {'range': [0, comparison['national_avg'] * 0.5], 'color': "lightgreen"},
-                        {'range': [comparison['national_avg'] * 0.5, comparison['national_avg'] * 0.8], 'color': "green"},
-                        {'range': [comparison['national_avg'] * 0.8, comparison['national_avg'] * 1.2], 'color': "yellow"},
-                        {'range': [comparison['national_avg'] * 1.2, comparison['national_avg'] * 2], 'color': "orange"},
-                        {'range': [comparison['national_avg'] * 2, comparison['national_avg'] * 3], 'color': "red"}
-                    ],
-                    'threshold': {
-                        'line': {'color': "red", 'width': 4},
-                        'thickness': 0.75,
-                        'value': comparison['national_avg']
-                    }
-                },
-                delta = {'reference': comparison['national_avg'], 'relative': True}
-            ))
-            
-            fig.update_layout(height=300, margin=dict(l=20, r=20, t=50, b=20))
+            fig = _build_gauge(results['annual_total'], comparison['national_avg'])
             st.plotly_chart(fig, use_container_width=True)
         
         st.markdown("---")
@@ -277,31 +376,21 @@ with tab2:
         # Display breakdown of emissions
         st.subheader("Breakdown of Your Carbon Footprint")
         
-        # Prepare data for pie chart
-        breakdown_data = pd.DataFrame({
-            'Category': list(results["weekly_breakdown"].keys()),
-            'Emissions (kg CO₂)': list(results["weekly_breakdown"].values())
-        })
+        # Prepare data for the breakdown table, largest category first
+        ordered = sorted(results["weekly_breakdown"].items(), key=lambda kv: -kv[1])
+        breakdown_data = pd.DataFrame(ordered, columns=['Category', 'Emissions (kg CO₂)'])
         
         col1, col2 = st.columns([3, 2])
         
         with col1:
             # Create pie chart
-            fig = px.pie(
-                breakdown_data,
-                values='Emissions (kg CO₂)',
-                names='Category',
-                title='Weekly Carbon Footprint by Category',
-                color_discrete_sequence=px.colors.sequential.Viridis
-            )
-            fig.update_traces(textposition='inside', textinfo='percent+label')
-            fig.update_layout(margin=dict(t=40, b=0, l=0, r=0))
-            st.plotly_chart(fig, use_container_width=True)
+            fig = _build_breakdown_pie(tuple(results["weekly_breakdown"].items()))
+            st.plotly_chart(fig, use_container_width=True, theme=None, key="results_breakdown_pie")
             
         with col2:
             # Display breakdown table
             st.dataframe(
-                breakdown_data.sort_values(by='Emissions (kg CO₂)', ascending=False),
+                breakdown_data,
                 use_container_width=True,
                 hide_index=True
             )
@@ -315,13 +404,13 @@ with tab2:
         # Option to download results as CSV
         st.subheader("Download Your Results")
         
-        emissions_df = utils.format_emissions_for_download(results)
-        
-        csv = emissions_df.to_csv(index=False)
-        b64 = base64.b64encode(csv.encode()).decode()
         download_filename = f"carbon_footprint_{datetime.now().strftime('%Y%m%d')}.csv"
-        href = f'<a href="data:file/csv;base64,{b64}" download="{download_filename}">Download CSV File</a>'
-        st.markdown(href, unsafe_allow_html=True)
+        st.download_button(
+            "Download CSV File",
+            data=_csv_bytes(results),
+            file_name=download_filename,
+            mime="text/csv"
+        )
         
         # Add option to save results to database
         st.markdown("---")
@@ -335,18 +424,32 @@ with tab2:
             
             if save_submitted:
                 if user_name and email:
+                    footprint_id = None
                     try:
                         footprint_id = database.save_footprint(user_name, email, results)
-                        st.success(f"Your footprint has been saved successfully! (ID: {footprint_id})")
-                        st.info("You can view your saved footprints in the 'Saved Footprints' tab.")
+                        _bump_fp_version()
                     except Exception as e:
                         st.error(f"An error occurred while saving your footprint: {str(e)}")
+                    
+                    if footprint_id is not None:
+                        # Rerun the full app so the Saved Footprints tab picks up the new footprint
+                        st.session_state.saved_footprint_id = footprint_id
+                        st.rerun()
                 else:
                     st.warning("Please provide both your name and email to save your footprint.")
+            
+            # Success message after the rerun
+            saved_footprint_id = st.session_state.pop("saved_footprint_id", None)
+            if saved_footprint_id is not None:
+                st.success(f"Your footprint has been saved successfully! (ID: {saved_footprint_id})")
+                st.info("You can view your saved footprints in the 'Saved Footprints' tab.")
         
     else:
         st.info("Please complete the calculator form in the Calculator tab to see your results.")
 
+with tab2:
+    results_tab()
+
 with tab3:
     st.header("Personalized Recommendations")
     
@@ -432,25 +535,11 @@ with tab4:
     """)
     
     # Create bar chart of national averages
-    national_data = pd.DataFrame({
-        'Country': list(utils.NATIONAL_AVERAGES.keys()),
-        'Annual CO₂ Emissions Per Person (kg)': list(utils.NATIONAL_AVERAGES.values())
-    })
-    
-    fig = px.bar(
-        national_data,
-        x='Country',
-        y='Annual CO₂ Emissions Per Person (kg)',
-        title='Average Annual Carbon Footprint by Country',
-        color='Annual CO₂ Emissions Per Person (kg)',
-        color_continuous_scale=px.colors.sequential.Viridis
-    )
-    fig.update_layout(xaxis_title="Country", yaxis_title="kg CO₂ per person")
-    
-    st.plotly_chart(fig, use_container_width=True)
+    st.plotly_chart(_national_bar_figure(), use_container_width=True, theme=None)
 
 # Tab 5: Saved Footprints
-with tab5:
+@st.fragment
+def saved_tab():
     st.header("Saved Carbon Footprints")
     st.write("View and manage your previously saved carbon footprint calculations.")
     
@@ -461,24 +550,28 @@ with tab5:
         
         if search_button and search_email:
             try:
-                footprints = database.get_footprints_by_email(search_email)
+                footprints = _cached_footprints_by_email(search_email, _current_fp_version())
+                by_id = {f["id"]: f for f in footprints}
                 if footprints:
-                    st.success(f"Found {len(footprints)} saved footprints for {search_email}")
+                    total = _cached_footprint_count_by_email(search_email, _current_fp_version())
+                    st.success(f"Found {total} saved footprints for {search_email}")
+                    if total > len(footprints):
+                        st.caption(f"Showing the {len(footprints)} most recent of {total}")
                     
                     # Convert to DataFrame for display
                     df = pd.DataFrame(footprints)
                     df = df[['id', 'user_name', 'weekly_total', 'annual_total', 'country', 'timestamp']]
                     df.columns = ['ID', 'Name', 'Weekly (kg CO₂)', 'Annual (kg CO₂)', 'Country', 'Date Saved']
                     
-                    st.dataframe(df, use_container_width=True)
+                    st.dataframe(df, use_container_width=True, column_config=_DATE_SAVED_COLUMN)
                     
                     # Option to view details of a specific footprint
                     selected_id = st.selectbox("Select a footprint to view details:", 
-                                              options=[f["id"] for f in footprints],
-                                              format_func=lambda x: f"ID: {x} - {next((f['timestamp'] for f in footprints if f['id'] == x), '')}")
+                                              options=list(by_id),
+                                              format_func=lambda x: f"ID: {x} - {by_id[x]['timestamp'].strftime('%Y-%m-%d %H:%M:%S')}")
                     
                     if selected_id:
-                        footprint = next((f for f in footprints if f["id"] == selected_id), None)
+                        footprint = by_id.get(selected_id)
                         if footprint:
                             st.subheader(f"Footprint Details for {footprint['user_name']}")
                             
@@ -502,24 +595,13 @@ with tab5:
                                 "Diet": footprint['diet_emissions']
                             }
                             
-                            fig_data = pd.DataFrame({
-                                'Category': list(breakdown_data.keys()),
-                                'Emissions (kg CO₂)': list(breakdown_data.values())
-                            })
-                            
-                            fig = px.pie(
-                                fig_data,
-                                values='Emissions (kg CO₂)',
-                                names='Category',
-                                title='Weekly Carbon Footprint by Category',
-                                color_discrete_sequence=px.colors.sequential.Viridis
-                            )
-                            fig.update_traces(textposition='inside', textinfo='percent+label')
-                            st.plotly_chart(fig, use_container_width=True)
+                            fig = _build_breakdown_pie(tuple(breakdown_data.items()))
+                            st.plotly_chart(fig, use_container_width=True, theme=None, key=f"saved_breakdown_pie_{selected_id}")
                             
                             # Delete option
                             if st.button(f"Delete Footprint ID: {selected_id}"):
                                 if database.delete_footprint(selected_id):
+                                    _bump_fp_version()
                                     st.success("Footprint deleted successfully!")
                                     st.rerun()
                                 else:
@@ -532,36 +614,37 @@ with tab5:
     # Show all saved footprints
     with st.expander("View All Saved Footprints"):
         try:
-            all_footprints = database.get_all_footprints()
-            if all_footprints:
-                st.write(f"Total saved footprints: {len(all_footprints)}")
+            stats = _cached_footprint_stats(_current_fp_version())
+            if stats["n"]:
+                st.write(f"Total saved footprints: {stats['n']}")
                 
-                # Convert to DataFrame for display
-                all_df = pd.DataFrame(all_footprints)
-                all_df = all_df[['id', 'user_name', 'email', 'weekly_total', 'annual_total', 'country', 'timestamp']]
-                all_df.columns = ['ID', 'Name', 'Email', 'Weekly (kg CO₂)', 'Annual (kg CO₂)', 'Country', 'Date Saved']
-                
-                st.dataframe(all_df, use_container_width=True)
-                
-                # Analytics on all footprints
-                if len(all_footprints) > 1:
+                # Analytics on all footprints (aggregated in the database)
+                if stats["n"] > 1:
                     st.subheader("Footprint Analytics")
                     
-                    avg_annual = sum(f['annual_total'] for f in all_footprints) / len(all_footprints)
-                    min_annual = min(f['annual_total'] for f in all_footprints)
-                    max_annual = max(f['annual_total'] for f in all_footprints)
-                    
                     col1, col2, col3 = st.columns(3)
-                    col1.metric("Average Annual Footprint", f"{avg_annual:.2f} kg CO₂")
-                    col2.metric("Minimum Annual Footprint", f"{min_annual:.2f} kg CO₂")
-                    col3.metric("Maximum Annual Footprint", f"{max_annual:.2f} kg CO₂")
+                    col1.metric("Average Annual Footprint", f"{stats['avg']:.2f} kg CO₂")
+                    col2.metric("Minimum Annual Footprint", f"{stats['mn']:.2f} kg CO₂")
+                    col3.metric("Maximum Annual Footprint", f"{stats['mx']:.2f} kg CO₂")
+                
+                # Only fetch the individual rows when the user asks for them
+                if st.checkbox("Show all saved footprints"):
+                    page_count = (stats["n"] - 1) // FOOTPRINTS_PER_PAGE + 1
+                    page = st.number_input("Page", min_value=1, max_value=page_count, step=1)
+                    offset = (page - 1) * FOOTPRINTS_PER_PAGE
+                    all_df = _cached_all_footprints_df(_current_fp_version(), offset)
+                    st.caption(f"Showing {offset + 1}-{offset + len(all_df)} of {stats['n']}")
                     
-                    # Time series of saved footprints
-                    if len(all_footprints) > 2:
+                    # Select and rename columns for display
+                    display_df = all_df[['id', 'user_name', 'email', 'weekly_total', 'annual_total', 'country', 'timestamp']]
+                    display_df.columns = ['ID', 'Name', 'Email', 'Weekly (kg CO₂)', 'Annual (kg CO₂)', 'Country', 'Date Saved']
+                    
+                    st.dataframe(display_df, use_container_width=True, column_config=_DATE_SAVED_COLUMN)
+                    
+                    # Time series of all saved footprints, not just this page (rows arrive sorted by timestamp)
+                    if stats["n"] > 2:
                         st.subheader("Footprints Over Time")
-                        time_df = pd.DataFrame(all_footprints)
-                        time_df['timestamp'] = pd.to_datetime(time_df['timestamp'])
-                        time_df = time_df.sort_values('timestamp')
+                        time_df = _cached_footprint_timeline_df(_current_fp_version())
                         
                         fig = px.line(
                             time_df, 
@@ -577,6 +660,9 @@ with tab5:
         except Exception as e:
             st.error(f"An error occurred while loading all footprints: {str(e)}")
 
+with tab5:
+    saved_tab()
+
 # Footer
 st.markdown("---")
 st.markdown("### 🌍 Carbon Footprint Calculator")
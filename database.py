@@ -1,15 +1,20 @@
 import os
+import pandas as pd
 import sqlalchemy as sa
 from sqlalchemy.ext.declarative import declarative_base
-from sqlalchemy.orm import sessionmaker
 from datetime import datetime
 
 # Get the PostgreSQL connection string from environment variables
 DATABASE_URL = os.environ.get("DATABASE_URL")
 
-# Create SQLAlchemy engine
-engine = sa.create_engine(DATABASE_URL)
-Session = sessionmaker(bind=engine)
+# Create SQLAlchemy engine (pooled connections shared by every request)
+engine = sa.create_engine(
+    DATABASE_URL,
+    pool_size=10,
+    max_overflow=5,
+    pool_pre_ping=True,
+    future=True
+)
 Base = declarative_base()
 
 # Define the CarbonFootprint table
@@ -18,7 +23,7 @@ class CarbonFootprint(Base):
     
     id = sa.Column(sa.Integer, primary_key=True)
     user_name = sa.Column(sa.String(100))
-    email = sa.Column(sa.String(100))
+    email = sa.Column(sa.String(100), index=True)
     weekly_total = sa.Column(sa.Float)
     annual_total = sa.Column(sa.Float)
     transport_emissions = sa.Column(sa.Float)
@@ -27,100 +32,131 @@ class CarbonFootprint(Base):
     household_emissions = sa.Column(sa.Float)
     diet_emissions = sa.Column(sa.Float)
     country = sa.Column(sa.String(50))
-    timestamp = sa.Column(sa.DateTime, default=datetime.now)
-    
-    def to_dict(self):
-        return {
-            "id": self.id,
-            "user_name": self.user_name,
-            "email": self.email,
-            "weekly_total": self.weekly_total,
-            "annual_total": self.annual_total,
-            "transport_emissions": self.transport_emissions,
-            "short_flights_emissions": self.short_flights_emissions,
-            "long_flights_emissions": self.long_flights_emissions,
-            "household_emissions": self.household_emissions,
-            "diet_emissions": self.diet_emissions,
-            "country": self.country,
-            "timestamp": self.timestamp.strftime("%Y-%m-%d %H:%M:%S")
-        }
-
-# Function to create the database tables
+    timestamp = sa.Column(sa.DateTime, default=datetime.now, index=True)
+
+# Prepared Core statements for the read paths (rows are returned as mappings, no ORM hydration)
+_footprints = CarbonFootprint.__table__
+_stmt_all = sa.select(
+    _footprints.c.id,
+    _footprints.c.user_name,
+    _footprints.c.email,
+    _footprints.c.weekly_total,
+    _footprints.c.annual_total,
+    _footprints.c.transport_emissions,
+    _footprints.c.short_flights_emissions,
+    _footprints.c.long_flights_emissions,
+    _footprints.c.household_emissions,
+    _footprints.c.diet_emissions,
+    _footprints.c.country,
+    _footprints.c.timestamp
+)
+_COLS = [c.key for c in _stmt_all.selected_columns]
+_stmt_by_id = _stmt_all.where(_footprints.c.id == sa.bindparam("footprint_id"))
+_stmt_by_email = _stmt_all.where(_footprints.c.email == sa.bindparam("email"))
+_stmt_count_by_email = sa.select(sa.func.count()).select_from(_footprints).where(
+    _footprints.c.email == sa.bindparam("email")
+)
+_stmt_timeline = sa.select(
+    _footprints.c.timestamp,
+    _footprints.c.annual_total,
+    _footprints.c.user_name
+).order_by(_footprints.c.timestamp.asc())
+_TIMELINE_COLS = [c.key for c in _stmt_timeline.selected_columns]
+_stmt_stats = sa.select(
+    sa.func.avg(_footprints.c.annual_total).label("avg"),
+    sa.func.min(_footprints.c.annual_total).label("mn"),
+    sa.func.max(_footprints.c.annual_total).label("mx"),
+    sa.func.count().label("n")
+)
+
+# Prepared Core writes (insert returns the new id, delete reports rowcount) without an ORM flush
+_insert = _footprints.insert().returning(_footprints.c.id, sort_by_parameter_order=True)
+_delete_by_id = _footprints.delete().where(_footprints.c.id == sa.bindparam("footprint_id"))
+
+# Function to create the database tables (called once at app startup, not on import)
 def create_tables():
     Base.metadata.create_all(engine)
+    create_indexes()
+
+# Function to add the lookup indexes to a table created before they were declared
+def create_indexes():
+    with engine.begin() as conn:
+        conn.execute(sa.text("CREATE INDEX IF NOT EXISTS ix_carbon_footprints_email ON carbon_footprints (email)"))
+        conn.execute(sa.text("CREATE INDEX IF NOT EXISTS ix_carbon_footprints_timestamp ON carbon_footprints (timestamp)"))
+
+# Function to build the insert parameters for one calculation
+def _footprint_row(user_name, email, results):
+    return {
+        "user_name": user_name,
+        "email": email,
+        "weekly_total": results["weekly_total"],
+        "annual_total": results["annual_total"],
+        "transport_emissions": results["weekly_breakdown"]["Transportation"],
+        "short_flights_emissions": results["weekly_breakdown"]["Short Flights"],
+        "long_flights_emissions": results["weekly_breakdown"]["Long Flights"],
+        "household_emissions": results["weekly_breakdown"]["Household Energy"],
+        "diet_emissions": results["weekly_breakdown"]["Diet"],
+        "country": results["comparison"]["country"]
+    }
 
 # Function to save a carbon footprint calculation to the database
 def save_footprint(user_name, email, results):
-    session = Session()
-    try:
-        footprint = CarbonFootprint(
-            user_name=user_name,
-            email=email,
-            weekly_total=results["weekly_total"],
-            annual_total=results["annual_total"],
-            transport_emissions=results["weekly_breakdown"]["Transportation"],
-            short_flights_emissions=results["weekly_breakdown"]["Short Flights"],
-            long_flights_emissions=results["weekly_breakdown"]["Long Flights"],
-            household_emissions=results["weekly_breakdown"]["Household Energy"],
-            diet_emissions=results["weekly_breakdown"]["Diet"],
-            country=results["comparison"]["country"]
-        )
-        session.add(footprint)
-        session.commit()
-        return footprint.id
-    except Exception as e:
-        session.rollback()
-        raise e
-    finally:
-        session.close()
-
-# Function to get all footprints
-def get_all_footprints():
-    session = Session()
-    try:
-        footprints = session.query(CarbonFootprint).all()
-        return [footprint.to_dict() for footprint in footprints]
-    finally:
-        session.close()
+    with engine.begin() as conn:
+        return conn.execute(_insert, _footprint_row(user_name, email, results)).scalar_one()
+
+# Function to save several (user_name, email, results) calculations in one round trip
+def save_footprints(entries):
+    rows = [_footprint_row(user_name, email, results) for user_name, email, results in entries]
+    if not rows:
+        return []
+    with engine.begin() as conn:
+        return conn.execute(_insert, rows).scalars().all()
+
+# Function to get all footprints, most recent first
+def get_all_footprints(limit=100, offset=0):
+    stmt = _stmt_all.order_by(_footprints.c.timestamp.desc()).limit(limit).offset(offset)
+    with engine.connect() as conn:
+        return conn.execute(stmt).mappings().all()
+
+# Function to get all footprints as a DataFrame (most recent first), streaming rows from the server in batches
+def get_all_footprints_df(limit=100, offset=0):
+    stmt = _stmt_all.order_by(_footprints.c.timestamp.desc()).limit(limit).offset(offset)
+    with engine.connect() as conn:
+        result = conn.execution_options(stream_results=True, yield_per=500).execute(stmt)
+        return pd.DataFrame.from_records(result, columns=_COLS)
+
+# Function to get the full history of annual footprints over time (only the columns the chart needs, not paginated)
+def get_footprint_timeline_df():
+    with engine.connect() as conn:
+        result = conn.execution_options(stream_results=True, yield_per=500).execute(_stmt_timeline)
+        return pd.DataFrame.from_records(result, columns=_TIMELINE_COLS)
+
+# Function to get summary statistics of all footprints, aggregated in the database
+def get_footprint_stats():
+    with engine.connect() as conn:
+        return dict(conn.execute(_stmt_stats).mappings().one())
 
 # Function to get a footprint by ID
 def get_footprint_by_id(footprint_id):
-    session = Session()
-    try:
-        footprint = session.query(CarbonFootprint).filter_by(id=footprint_id).first()
-        if footprint:
-            return footprint.to_dict()
-        return None
-    finally:
-        session.close()
-
-# Function to get footprints by email
-def get_footprints_by_email(email):
-    session = Session()
-    try:
-        footprints = session.query(CarbonFootprint).filter_by(email=email).all()
-        return [footprint.to_dict() for footprint in footprints]
-    finally:
-        session.close()
+    with engine.connect() as conn:
+        return conn.execute(_stmt_by_id, {"footprint_id": footprint_id}).mappings().first()
+
+# Function to get footprints by email, most recent first
+def get_footprints_by_email(email, limit=100, offset=0):
+    stmt = _stmt_by_email.order_by(_footprints.c.timestamp.desc()).limit(limit).offset(offset)
+    with engine.connect() as conn:
+        return conn.execute(stmt, {"email": email}).mappings().all()
+
+# Function to count the footprints saved under an email without fetching them
+def count_footprints_by_email(email):
+    with engine.connect() as conn:
+        return conn.execute(_stmt_count_by_email, {"email": email}).scalar_one()
 
 # Function to delete a footprint by ID
 def delete_footprint(footprint_id):
-    session = Session()
-    try:
-        footprint = session.query(CarbonFootprint).filter_by(id=footprint_id).first()
-        if footprint:
-            session.delete(footprint)
-            session.commit()
-            return True
-        return False
-    except Exception as e:
-        session.rollback()
-        raise e
-    finally:
-        session.close()
-
-# Initialize the database tables
-create_tables()
+    with engine.begin() as conn:
+        result = conn.execute(_delete_by_id, {"footprint_id": footprint_id})
+        return result.rowcount > 0
 
 [server]
 headless = true
@@ -1,8 +1,20 @@
 import pandas as pd
 import numpy as np
+from enum import IntEnum
+from functools import lru_cache
+from types import MappingProxyType
 
-# Emission factors (kg CO2)
-EMISSION_FACTORS = {
+# numba is optional; without it the recommendation kernels run as plain Python
+try:
+    from numba import njit
+except ImportError:
+    def njit(*args, **kwargs):
+        if len(args) == 1 and callable(args[0]) and not kwargs:
+            return args[0]
+        return lambda func: func
+
+# Emission factors (kg CO2), read-only so they can be shared safely across caches and threads
+EMISSION_FACTORS = MappingProxyType({
     "car_petrol": 0.21,  # per km (average small petrol car)
     "car_diesel": 0.18,  # per km (average small diesel car)
     "car_electric": 0.05,  # per km (electric vehicle using grid electricity)
@@ -17,10 +29,39 @@ EMISSION_FACTORS = {
     "meat_chicken": 0.9,  # per meal (chicken)
     "vegetarian": 0.5,  # per meal (vegetarian)
     "vegan": 0.4,  # per meal (vegan)
-}
+})
+
+# Integer emission categories, in the same order as EMISSION_FACTORS
+class Category(IntEnum):
+    CAR_PETROL = 0
+    CAR_DIESEL = 1
+    CAR_ELECTRIC = 2
+    PUBLIC_TRANSPORT = 3
+    MOTORCYCLE = 4
+    FLIGHT_SHORT = 5
+    FLIGHT_LONG = 6
+    ELECTRICITY = 7
+    NATURAL_GAS = 8
+    MEAT_BEEF = 9
+    MEAT_PORK = 10
+    MEAT_CHICKEN = 11
+    VEGETARIAN = 12
+    VEGAN = 13
+
+# Emission factors indexed by Category, as a tuple for scalar lookups and an array for vectorized scoring
+_FACTORS = tuple(EMISSION_FACTORS[c.name.lower()] for c in Category)
+EMISSION_FACTORS_ARRAY = np.array(_FACTORS, dtype=np.float64)
+_HOUSEHOLD_COEFS = EMISSION_FACTORS_ARRAY[[Category.ELECTRICITY, Category.NATURAL_GAS]]
 
-# National averages (kg CO2 per year)
-NATIONAL_AVERAGES = {
+# Category names in Category order, for hot loops that build rows indexed by Category
+_EF_KEYS = tuple(c.name.lower() for c in Category)
+
+# Map from the string keys of EMISSION_FACTORS to their Category (convert once at the API boundary)
+CATEGORY_INDEX = {c.name.lower(): c for c in Category}
+_VALID_CATEGORIES = frozenset(EMISSION_FACTORS)
+
+# National averages (kg CO2 per year), read-only
+NATIONAL_AVERAGES = MappingProxyType({
     "UK": 5200,
     "USA": 16000,
     "EU": 6800,
@@ -29,42 +70,75 @@ NATIONAL_AVERAGES = {
     "India": 1900,
     "Australia": 15000,
     "Canada": 14000,
-}
+})
+
+def validate_categories(categories):
+    """Raise KeyError for any name that is not an emission category (check inputs once, at the UI boundary)."""
+    unknown = [c for c in categories if c not in _VALID_CATEGORIES]
+    if unknown:
+        raise KeyError(f"Unknown emission categories: {', '.join(map(repr, unknown))}")
+
+def category_codes(categories):
+    """Convert emission category names to an array of integer codes for calculate_emissions_batch."""
+    return np.fromiter((CATEGORY_INDEX[c] for c in categories), dtype=np.int8)
+
+def calculate_emissions_batch(codes, amounts):
+    """Calculate emissions for arrays of category codes and amounts (distance, kWh or meals)."""
+    return EMISSION_FACTORS_ARRAY[codes] * amounts
+
+def compute_weekly_total(entries):
+    """Calculate weekly emissions for a dict of {category name: weekly amount} in one vectorized pass.
+
+    Returns the total and a dict of the emissions per category, in the order of entries.
+    """
+    codes = np.fromiter((CATEGORY_INDEX[k] for k in entries), dtype=np.int8, count=len(entries))
+    amounts = np.fromiter(entries.values(), dtype=np.float64, count=len(entries))
+    emissions = EMISSION_FACTORS_ARRAY[codes] * amounts
+    return float(emissions.sum()), dict(zip(entries.keys(), emissions.tolist()))
 
 def calculate_transportation_emissions(transport_type, distance):
-    """Calculate weekly emissions from transportation."""
-    return distance * EMISSION_FACTORS.get(transport_type, 0)
+    """Calculate weekly emissions from transportation (transport_type is a Category)."""
+    return distance * _FACTORS[transport_type]
 
 def calculate_household_emissions(electricity_kwh, gas_kwh=0):
     """Calculate weekly emissions from household energy use."""
-    electricity_emissions = electricity_kwh * EMISSION_FACTORS["electricity"]
-    gas_emissions = gas_kwh * EMISSION_FACTORS["natural_gas"]
+    electricity_emissions = electricity_kwh * _FACTORS[Category.ELECTRICITY]
+    gas_emissions = gas_kwh * _FACTORS[Category.NATURAL_GAS]
     return electricity_emissions + gas_emissions
 
+def calculate_household_emissions_batch(energy_kwh):
+    """Calculate weekly household emissions for an (N, 2) array of [electricity_kwh, gas_kwh] rows."""
+    return np.asarray(energy_kwh, dtype=np.float64) @ _HOUSEHOLD_COEFS
+
 def calculate_food_emissions(diet_type, meals_per_week):
-    """Calculate weekly emissions from food choices."""
-    return meals_per_week * EMISSION_FACTORS.get(diet_type, 0)
+    """Calculate weekly emissions from food choices (diet_type is a Category)."""
+    return meals_per_week * _FACTORS[diet_type]
+
+# Comparison statuses are returned as small int codes; use STATUS_LABELS to display them
+STATUS_LABELS = ("low", "below_avg", "average", "above_avg", "high")
+STATUS_CODES = {label: code for code, label in enumerate(STATUS_LABELS)}
+
+# Inclusive upper bounds of the comparison bands (percentage of the national average), one status and message per band
+_THRESHOLDS = np.array([50, 80, 100, 120], dtype=np.float64)
+_STATUS_INT8 = tuple(np.int8(code) for code in range(len(STATUS_LABELS)))
+_TEMPLATES = (
+    "Your carbon footprint is significantly lower than the {country} average. Excellent!",
+    "Your carbon footprint is below the {country} average. Good job!",
+    "Your carbon footprint is close to the {country} average.",
+    "Your carbon footprint is above the {country} average.",
+    "Your carbon footprint is significantly higher than the {country} average.",
+)
+
+@lru_cache(maxsize=2048)
+def _comparison_text(band, country):
+    """Return the (status code, message) pair for a comparison band and country."""
+    return _STATUS_INT8[band], _TEMPLATES[band].format(country=country)
 
 def get_footprint_comparison(annual_footprint, country="UK"):
     """Compare the user's footprint to the national average for a country."""
     national_avg = NATIONAL_AVERAGES.get(country, NATIONAL_AVERAGES["World"])
     percentage = (annual_footprint / national_avg) * 100
-    
-    if percentage > 120:
-        message = f"Your carbon footprint is significantly higher than the {country} average."
-        status = "high"
-    elif percentage > 100:
-        message = f"Your carbon footprint is above the {country} average."
-        status = "above_avg"
-    elif percentage > 80:
-        message = f"Your carbon footprint is close to the {country} average."
-        status = "average"
-    elif percentage > 50:
-        message = f"Your carbon footprint is below the {country} average. Good job!"
-        status = "below_avg"
-    else:
-        message = f"Your carbon footprint is significantly lower than the {country} average. Excellent!"
-        status = "low"
+    status, message = _comparison_text(int(np.searchsorted(_THRESHOLDS, percentage)), country)
     
     return {
         "country": country,
@@ -74,57 +148,112 @@ def get_footprint_comparison(annual_footprint, country="UK"):
         "status": status
     }
 
-def get_recommendations(emissions_data):
-    """Generate personalized recommendations based on emissions data."""
-    recommendations = []
-    
-    # Transportation recommendations
-    if emissions_data.get("car_petrol", 0) > 30 or emissions_data.get("car_diesel", 0) > 30:
-        recommendations.append("Consider carpooling, using public transport, or cycling for short journeys to reduce your driving emissions.")
-    
-    if emissions_data.get("flight_short", 0) > 50 or emissions_data.get("flight_long", 0) > 100:
-        recommendations.append("Reduce the number of flights you take. Consider trains for shorter journeys or virtual meetings instead of business travel.")
-    
-    # Household recommendations
-    if emissions_data.get("electricity", 0) > 40:
-        recommendations.append("Reduce your electricity consumption by using energy-efficient appliances, LED bulbs, and being mindful of standby power.")
-    
-    if emissions_data.get("natural_gas", 0) > 30:
-        recommendations.append("Improve your home insulation and consider lowering your heating thermostat by 1-2°C to save energy.")
-    
-    # Diet recommendations
-    if emissions_data.get("meat_beef", 0) > 15:
-        recommendations.append("Consider reducing beef consumption. Beef has one of the highest carbon footprints among food items.")
-    
-    if (emissions_data.get("meat_beef", 0) + emissions_data.get("meat_pork", 0) + 
-            emissions_data.get("meat_chicken", 0)) > 20:
-        recommendations.append("Try introducing 1-2 meat-free days per week to reduce your food-related carbon footprint.")
-    
-    # General recommendations if specific areas don't trigger recommendations
-    if not recommendations:
-        recommendations = [
-            "Consider using renewable energy sources for your home.",
-            "Look into carbon offsetting programs for emissions you can't reduce.",
-            "Reduce, reuse, and recycle to minimize waste-related emissions.",
-            "Support local businesses to reduce transportation emissions from goods."
-        ]
+def get_footprint_comparison_batch(annual_footprints, country="UK"):
+    """Compare an array of annual footprints to the national average, returning arrays of percentages and status codes."""
+    national_avg = NATIONAL_AVERAGES.get(country, NATIONAL_AVERAGES["World"])
+    percentage = np.asarray(annual_footprints, dtype=np.float64) / national_avg * 100
+    idx = np.searchsorted(_THRESHOLDS, percentage)
     
-    return recommendations
+    return {
+        "country": country,
+        "national_avg": national_avg,
+        "percentage": percentage,
+        "status": idx.astype(np.int8)
+    }
+
+# Recommendation messages (static, shared by every call)
+# Transportation recommendations
+_REC_DRIVE = "Consider carpooling, using public transport, or cycling for short journeys to reduce your driving emissions."
+_REC_FLIGHT = "Reduce the number of flights you take. Consider trains for shorter journeys or virtual meetings instead of business travel."
+# Household recommendations
+_REC_ELECTRICITY = "Reduce your electricity consumption by using energy-efficient appliances, LED bulbs, and being mindful of standby power."
+_REC_HEATING = "Improve your home insulation and consider lowering your heating thermostat by 1-2°C to save energy."
+# Diet recommendations
+_REC_BEEF = "Consider reducing beef consumption. Beef has one of the highest carbon footprints among food items."
+_REC_MEAT_FREE = "Try introducing 1-2 meat-free days per week to reduce your food-related carbon footprint."
+
+# Targeted recommendations, in the bit order of the mask returned by _recommend_mask
+_RECOMMENDATIONS = (_REC_DRIVE, _REC_FLIGHT, _REC_ELECTRICITY, _REC_HEATING, _REC_BEEF, _REC_MEAT_FREE)
+
+# General recommendations if specific areas don't trigger recommendations
+_REC_GENERAL = (
+    "Consider using renewable energy sources for your home.",
+    "Look into carbon offsetting programs for emissions you can't reduce.",
+    "Reduce, reuse, and recycle to minimize waste-related emissions.",
+    "Support local businesses to reduce transportation emissions from goods.",
+)
+
+# Recommendation tuple for every possible mask, so lookups return shared constants
+_RECOMMENDATIONS_BY_MASK = tuple(
+    tuple(rec for bit, rec in enumerate(_RECOMMENDATIONS) if mask & (1 << bit)) or _REC_GENERAL
+    for mask in range(1 << len(_RECOMMENDATIONS))
+)
+
+@njit(cache=True)
+def _recommend_mask(row):
+    """Return a bitmask of the recommendations that apply to one row of emissions indexed by Category."""
+    m = 0
+    if row[Category.CAR_PETROL] > 30 or row[Category.CAR_DIESEL] > 30:
+        m |= 1
+    if row[Category.FLIGHT_SHORT] > 50 or row[Category.FLIGHT_LONG] > 100:
+        m |= 2
+    if row[Category.ELECTRICITY] > 40:
+        m |= 4
+    if row[Category.NATURAL_GAS] > 30:
+        m |= 8
+    if row[Category.MEAT_BEEF] > 15:
+        m |= 16
+    if row[Category.MEAT_BEEF] + row[Category.MEAT_PORK] + row[Category.MEAT_CHICKEN] > 20:
+        m |= 32
+    return m
+
+@njit(cache=True)
+def _recommend_masks(arr):
+    """Return the recommendation bitmask for every row of an (n_users, n_categories) emissions array."""
+    out = np.empty(arr.shape[0], np.uint16)
+    for i in range(arr.shape[0]):
+        out[i] = _recommend_mask(arr[i])
+    return out
+
+def emissions_to_row(emissions_data):
+    """Convert a dict of emissions keyed by EMISSION_FACTORS names to an array indexed by Category."""
+    return np.fromiter((emissions_data.get(name, 0) for name in _EF_KEYS), dtype=np.float64, count=len(_EF_KEYS))
+
+def get_recommendations(emissions_data):
+    """Generate personalized recommendations based on emissions data.
+
+    Returns a shared tuple of constant strings; callers must not try to modify it.
+    """
+    return _RECOMMENDATIONS_BY_MASK[_recommend_mask(emissions_to_row(emissions_data))]
+
+def get_recommendations_batch(emissions_array):
+    """Generate recommendations for each row of an (n_users, n_categories) array indexed by Category."""
+    arr = np.ascontiguousarray(emissions_array, dtype=np.float64)
+    # The kernel does not bounds-check row[Category.*], so reject anything but one full row per user
+    if arr.ndim != 2 or arr.shape[1] != len(Category):
+        raise ValueError(f"Expected an array of shape (n_users, {len(Category)}), got {arr.shape}")
+    masks = _recommend_masks(arr)
+    return [_RECOMMENDATIONS_BY_MASK[mask] for mask in masks]
 
 def format_emissions_for_download(data):
     """Format emissions data for download as CSV."""
-    rows = []
-    
     # Add weekly emissions
-    for category, value in data["weekly_breakdown"].items():
-        rows.append({"Category": category, "Timeframe": "Weekly", "Emissions (kg CO2)": value})
+    cats = list(data["weekly_breakdown"].keys())
+    vals = list(data["weekly_breakdown"].values())
+    times = ["Weekly"] * len(cats)
     
     # Add totals
-    rows.append({"Category": "Total", "Timeframe": "Weekly", "Emissions (kg CO2)": data["weekly_total"]})
-    rows.append({"Category": "Total", "Timeframe": "Annual", "Emissions (kg CO2)": data["annual_total"]})
+    cats += ["Total", "Total"]
+    times += ["Weekly", "Annual"]
+    vals += [data["weekly_total"], data["annual_total"]]
     
     # Add comparison
-    rows.append({"Category": "National Average", "Timeframe": "Annual", 
-                 "Emissions (kg CO2)": data["comparison"]["national_avg"]})
+    cats.append("National Average")
+    times.append("Annual")
+    vals.append(data["comparison"]["national_avg"])
     
-    return pd.DataFrame(rows)
\ No newline at end of file
+    return pd.DataFrame({
+        "Category": pd.Categorical(cats),
+        "Timeframe": pd.Categorical(times),
+        "Emissions (kg CO2)": vals
+    })